@@ -410,11 +410,13 @@ class Mach9:
     async def get_body(self, message, channels):
         body = message.get('body', b'')
         if 'body' in channels:
+            chunks = [body]
             while True:
                 message_chunk = await channels['body'].receive()
-                body += message_chunk['content']
+                chunks.append(message_chunk['content'])
                 if not message_chunk.get('more_content', False):
                     break
+            body = b''.join(chunks)
         return body
 
     async def __call__(self, message, channels):
@@ -0,0 +1,20 @@
+class Connections:
+    '''Live protocols keyed by identity, so adding and removing a
+    connection never calls a protocol's __hash__ or __eq__
+    '''
+    __slots__ = ('_connections',)
+
+    def __init__(self):
+        self._connections = {}
+
+    def add(self, connection):
+        self._connections[id(connection)] = connection
+
+    def discard(self, connection):
+        self._connections.pop(id(connection), None)
+
+    def __iter__(self):
+        return iter(self._connections.values())
+
+    def __len__(self):
+        return len(self._connections)
@@ -1,4 +1,5 @@
 import asyncio
+import re
 import traceback
 from httptools import HttpParserUpgrade
 from httptools import HttpRequestParser, parse_url
@@ -10,6 +11,43 @@ from mach9.websocket import upgrade_to_websocket
 from mach9.timer import get_current_time
 
 
+# Header names are case-insensitive (RFC 7230 3.2), the canonical
+# spellings are listed too so they match without lower-casing
+_CHECKED_HEADERS = {
+    b'connection': 'connection_close',
+    b'Connection': 'connection_close',
+    b'content-length': 'content_length',
+    b'Content-Length': 'content_length',
+}
+# Names of any other length cannot match, so they are never lower-cased
+_CHECKED_HEADER_LENGTHS = frozenset(map(len, _CHECKED_HEADERS))
+# Connection is a comma separated token list, e.g. "keep-alive, close"
+_CLOSE_RE = re.compile(rb'(?:\A|,)\s*close\s*(?:,|\Z)', re.IGNORECASE)
+# Keys that mark a message as the start of a response
+_RESPONSE_START_KEYS = frozenset(('status', 'headers'))
+
+
+def _make_error_response(status: int, message: str) -> bytes:
+    content = 'Error: {}'.format(message).encode()
+    return (
+        b'HTTP/1.1 %d %b\r\n'
+        b'Connection: close\r\n'
+        b'Content-Length: %d\r\n'
+        b'\r\n'
+        b'%b') % (status, ALL_STATUS_CODES[status], len(content), content)
+
+
+# The connection is always closed after these, so they never change
+_ERROR_RESPONSES = {
+    exception: _make_error_response(*exception)
+    for exception in (
+        (400, 'Bad Request'),
+        (408, 'Request Timeout'),
+        (413, 'Payload Too Large'),
+    )
+}
+
+
 class BodyChannel(asyncio.Queue):
 
     def __init__(self, transport):
@@ -54,6 +92,7 @@ class HttpProtocol(asyncio.Protocol):
         # connection management
         '_is_upgrade',
         '_total_request_size', '_timeout_handler', '_last_request_time',
+        '_connection_info',
         'body_channel', 'message')
 
     def __init__(self, *, loop, request_handler: Awaitable,
@@ -82,6 +121,8 @@ class HttpProtocol(asyncio.Protocol):
         self._request_handler_task = None
         self._request_stream_task = None
         self._is_upgrade = False
+        # (default scheme, peername, sockname), fixed for the connection
+        self._connection_info = None
         # config.KEEP_ALIVE or not check_headers()['connection_close']
         self._keep_alive = keep_alive
 
@@ -127,12 +168,17 @@ class HttpProtocol(asyncio.Protocol):
     # -------------------------------------------- #
 
     def data_received(self, data: bytes):
+        # An error response was already written and the connection is
+        # closing, do not buffer or parse anything else from it
+        if self.transport.is_closing():
+            return
         # Check for the request itself getting too large and exceeding
         # memory limits
         self._total_request_size += len(data)
         if self._total_request_size > self.request_max_size:
             exception = (413, 'Payload Too Large')
             self.write_error(exception)
+            return
 
         # Create parser if this is the first time we're receiving data
         if self.parser is None:
@@ -204,14 +250,17 @@ class HttpProtocol(asyncio.Protocol):
         '''
         http://channels.readthedocs.io/en/stable/asgi/www.html#request
         '''
+        # keep-alive connections ask for these on every request
+        connection_info = self._connection_info
+        if connection_info is None:
+            connection_info = self._connection_info = (
+                'https' if transport.get_extra_info('sslcontext') else 'http',
+                transport.get_extra_info('peername'),
+                transport.get_extra_info('sockname'))
+        default_scheme, client, server = connection_info
         url_obj = parse_url(url)
-        if url_obj.schema is None:
-            if transport.get_extra_info('sslcontext'):
-                scheme = 'https'
-            else:
-                scheme = 'http'
-        else:
-            scheme = url_obj.schema.decode()
+        scheme = (default_scheme if url_obj.schema is None
+                  else url_obj.schema.decode())
         path = '' if url_obj.path is None else url_obj.path.decode('utf-8')
         query = b'' if url_obj.query is None else url_obj.query
         return {
@@ -226,22 +275,28 @@ class HttpProtocol(asyncio.Protocol):
             'headers': headers,
             'body': b'',
             'body_channel': None,
-            'client': transport.get_extra_info('peername'),
-            'server': transport.get_extra_info('sockname')
+            'client': client,
+            'server': server
         }
 
     def check_headers(self, headers: List[List[bytes]]) -> Dict[str, bool]:
-        connection_close = False
-        content_length = False
-        for key, value in headers:
-            if key == b'Connection' and value == b'close':
-                connection_close = True
-            if key == b'Content-Length':
-                content_length = True
-        return {
-            'connection_close': connection_close,
-            'content_length': content_length
+        result = {
+            'connection_close': False,
+            'content_length': False
         }
+        get_checked = _CHECKED_HEADERS.get
+        checked_lengths = _CHECKED_HEADER_LENGTHS
+        for key, value in headers:
+            if len(key) not in checked_lengths:
+                continue
+            checked = get_checked(key)
+            if checked is None:
+                checked = get_checked(key.lower())
+            if checked == 'content_length':
+                result[checked] = True
+            elif checked is not None and _CLOSE_RE.search(value):
+                result[checked] = True
+        return result
 
     def after_write(self, more_content, keep_alive):
         if not more_content and not keep_alive:
@@ -251,22 +306,24 @@ class HttpProtocol(asyncio.Protocol):
             self.cleanup()
 
     def is_response_chunk(self, message: Dict[str, Any]) -> bool:
-        return 'status' not in message and 'headers' not in message
+        return _RESPONSE_START_KEYS.isdisjoint(message)
 
     def make_header_content(self, headers, result_headers,
                             content, more_content):
-        header_content = b''
-        if headers is not None:
-            _header_content = []
-            if not more_content and not result_headers['content_length']:
-                _header_content.extend([b'Content-Length: ',
-                                        str(len(content)).encode(), b'\r\n'])
-            for key, value in headers:
-                if key == b'Connection':
-                    continue
-                _header_content.extend([key, b': ', value, b'\r\n'])
-            header_content = b''.join(_header_content)
-        return header_content
+        if headers is None:
+            return b''
+        parts = []
+        append = parts.append
+        checked_lengths = _CHECKED_HEADER_LENGTHS
+        if not more_content and not result_headers['content_length']:
+            append(b'Content-Length: %d\r\n' % len(content))
+        for key, value in headers:
+            # the Connection header is always written by send()
+            if (len(key) in checked_lengths and
+                    _CHECKED_HEADERS.get(key.lower()) == 'connection_close'):
+                continue
+            append(b'%b: %b\r\n' % (key, value))
+        return b''.join(parts)
 
     def send(self, message: Dict[str, Any]):
         transport = self.transport
@@ -316,6 +373,10 @@ class HttpProtocol(asyncio.Protocol):
 
     def write_error(self, exception):
         try:
+            response = _ERROR_RESPONSES.get(exception)
+            if response is not None:
+                self.transport.write(response)
+                return
             status, content = exception
             content = 'Error: {}'.format(content).encode()
             headers = []
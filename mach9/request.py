@@ -2,7 +2,11 @@ from cgi import parse_header
 from collections import namedtuple
 from http.cookies import SimpleCookie
 from urllib.parse import parse_qs, urlunparse
-from ujson import loads as json_loads
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from ujson import loads as json_loads
 
 from mach9.exceptions import InvalidUsage
 
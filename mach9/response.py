@@ -1,10 +1,16 @@
 import re
 import string
+from functools import lru_cache
 from mimetypes import guess_type
 from os import path
 from ujson import dumps as json_dumps
 from aiofiles import open as open_async
 
+try:
+    from orjson import dumps as orjson_dumps
+except ImportError:
+    orjson_dumps = None
+
 COMMON_STATUS_CODES = {
     200: b'OK',
     400: b'Bad Request',
@@ -211,6 +217,12 @@ class MultiHeader:
         return self.name.encode()
 
 
+@lru_cache(maxsize=64)
+def _encode_content_type(content_type):
+    '''Content types come from a handful of constants, encode each once'''
+    return content_type.encode('utf-8')
+
+
 class HTTPResponse:
 
     def __init__(self, body=None, status=200, headers=None,
@@ -233,6 +245,9 @@ class HTTPResponse:
         return self._cookies
 
     def _encode_body(self, data):
+        if isinstance(data, (bytes, bytearray)):
+            # Already encoded, e.g. text() with a pre-rendered body
+            return bytes(data)
         try:
             # Try to encode it regularly
             return data.encode()
@@ -241,6 +256,12 @@ class HTTPResponse:
             return str(data).encode()
 
     def _parse_headers(self):
+        # Most responses only carry their Content-Type
+        if (len(self.headers) == 1 and
+                self.headers.get('Content-Type') is self.content_type and
+                isinstance(self.content_type, str)):
+            return [[b'Content-Type',
+                     _encode_content_type(self.content_type)]]
         headers = []
         for name, value in self.headers.items():
             try:
@@ -299,11 +320,30 @@ def stream(handler, status=200, headers=None,
 def json(body, status=200, headers=None, **kwargs):
     '''
     Returns response object with body in json format.
+
+    When the optional orjson extra is installed and no kwargs are given,
+    the body is serialized with orjson, falling back to ujson for data
+    orjson rejects (e.g. non-str dict keys). The two differ in output:
+    ujson escapes '/' and non-ASCII characters, orjson writes them as
+    UTF-8, and orjson silently writes NaN and Infinity as null.
+
     :param body: Response data to be serialized.
     :param status: Response code.
     :param headers: Custom Headers.
     :param kwargs: Remaining arguments that are passed to the json encoder.
     '''
+    # orjson is used when installed and no ujson specific options are given,
+    # it serializes straight to UTF-8 bytes
+    if orjson_dumps is not None and not kwargs:
+        try:
+            body_bytes = orjson_dumps(body)
+        except TypeError:
+            # e.g. non-str dict keys, which ujson accepts
+            pass
+        else:
+            return HTTPResponse(body_bytes=body_bytes, headers=headers,
+                                status=status,
+                                content_type='application/json')
     return HTTPResponse(json_dumps(body, **kwargs), headers=headers,
                         status=status, content_type='application/json')
 
@@ -312,7 +352,7 @@ def text(body, status=200, headers=None,
          content_type='text/plain; charset=utf-8'):
     '''
     Returns response object with body in text format.
-    :param body: Response data to be encoded.
+    :param body: Response data to be encoded, bytes are sent as they are.
     :param status: Response code.
     :param headers: Custom Headers.
     :param content_type: the content type (string) of the response
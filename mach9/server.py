@@ -1,26 +1,74 @@
 import asyncio
+import ctypes
 import logging
 import os
-import uvloop
+import sys
 from functools import partial
 from inspect import isawaitable
 from multiprocessing import Process
 from ssl import create_default_context, Purpose
 from signal import (
-    SIGTERM, SIGINT,
+    SIGTERM, SIGINT, SIG_DFL,
     signal as signal_func,
     Signals
 )
 from socket import (
     socket,
+    AF_INET,
+    IPPROTO_TCP,
+    SOCK_STREAM,
     SOL_SOCKET,
     SO_REUSEADDR,
+    TCP_NODELAY,
 )
+try:
+    from socket import SO_REUSEPORT
+except ImportError:  # pragma: no cover
+    SO_REUSEPORT = None
 
+from mach9.connections import Connections
 from mach9.http import HttpProtocol
 from mach9.signal import Signal
 from mach9.timer import update_current_time
 
+# uvloop does not run on Windows, fall back to the default asyncio loop
+if sys.platform != 'win32':
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+PR_SET_PDEATHSIG = 1
+
+
+def _set_pdeathsig(sig):
+    '''Ask the kernel to send `sig` to this process once its parent dies.
+
+    :return: False where prctl is not available (non Linux)
+    :raises OSError: if the prctl call fails
+    '''
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        prctl = ctypes.CDLL(None, use_errno=True).prctl
+    except (OSError, AttributeError):
+        return False
+    if prctl(PR_SET_PDEATHSIG, int(sig), 0, 0, 0) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return True
+
+
+# SO_REUSEPORT only balances connections between sockets on Linux
+_PER_WORKER_SOCKETS = (sys.platform.startswith('linux') and
+                       SO_REUSEPORT is not None)
+
+# Event loops on Windows do not implement add_signal_handler
+_HAS_SIGNAL_HANDLER = sys.platform != 'win32'
+
 
 class Server:
 
@@ -130,15 +178,19 @@ class Server:
               reuse_port=False, loop=None, protocol=None, backlog=100,
               connections=None, signal=None, has_log=True, keep_alive=True,
               log=None, netlog=None):
-        self.loop = loop = uvloop.new_event_loop()
-        asyncio.set_event_loop(loop)
+        if loop is None:
+            # the event loop policy hands out uvloop loops when available
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        self.loop = loop
 
         if debug:
             loop.set_debug(debug)
 
         self.trigger_events(before_start, loop)
 
-        connections = connections if connections is not None else set()
+        if connections is None:
+            connections = Connections()
         server = partial(
             protocol,
             loop=loop,
@@ -175,12 +227,12 @@ class Server:
         self.trigger_events(after_start, loop)
 
         # Register signals for graceful termination
-        for _signal in (SIGINT, SIGTERM):
-            try:
+        if _HAS_SIGNAL_HANDLER:
+            for _signal in (SIGINT, SIGTERM):
                 loop.add_signal_handler(_signal, loop.stop)
-            except NotImplementedError:
-                log.warn('Mach9 tried to use loop.add_signal_handler but it is'
-                         ' not implemented on this platform.')
+        else:
+            log.warn('Mach9 tried to use loop.add_signal_handler but it is'
+                     ' not implemented on this platform.')
         pid = os.getpid()
         try:
             log.info('Starting worker [{}]'.format(pid))
@@ -197,7 +249,7 @@ class Server:
 
             # Complete all tasks on the loop
             signal.stopped = True
-            for connection in connections:
+            for connection in list(connections):
                 connection.close_if_idle()
 
             while connections:
@@ -207,13 +259,42 @@ class Server:
 
             loop.close()
 
+    def serve_worker(self, parent_pid, **server_settings):
+        '''Entry point of a worker process started by `serve_multiple`.
+
+        On Linux the kernel is asked to deliver SIGTERM to the worker if
+        the parent dies without shutting it down, so workers can never
+        outlive it.
+        '''
+        # Drop the parent's fan-out handlers inherited over fork, so a
+        # SIGTERM arriving before `serve` installs its own handlers
+        # terminates the worker
+        signal_func(SIGINT, SIG_DFL)
+        signal_func(SIGTERM, SIG_DFL)
+        try:
+            pdeathsig = _set_pdeathsig(SIGTERM)
+        except OSError as e:
+            server_settings['log'].warning(
+                'Unable to set PR_SET_PDEATHSIG: {}'.format(e))
+        else:
+            # The parent may have died before prctl took effect
+            if pdeathsig and os.getppid() != parent_pid:
+                return
+        self.serve(**server_settings)
+
     def serve_multiple(self, server_settings, workers):
         server_settings['reuse_port'] = True
 
-        # Handling when custom socket is not provided.
-        if server_settings.get('sock') is None:
-            sock = socket()
+        # Handling when custom socket is not provided. With SO_REUSEPORT
+        # each worker binds its own listening socket to the port in
+        # `serve`, and the kernel balances new connections across them.
+        # Otherwise all workers accept from one inherited socket.
+        if (server_settings.get('sock') is None and
+                not _PER_WORKER_SOCKETS):
+            sock = socket(AF_INET, SOCK_STREAM)
             sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+            # Accepted connections inherit TCP_NODELAY where supported
+            sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
             sock.bind((server_settings['host'], server_settings['port']))
             sock.set_inheritable(True)
             server_settings['sock'] = sock
@@ -231,8 +312,10 @@ class Server:
         signal_func(SIGTERM, lambda s, f: sig_handler(s, f))
 
         processes = []
+        parent_pid = os.getpid()
         for _ in range(workers):
-            process = Process(target=self.serve, kwargs=server_settings)
+            process = Process(target=self.serve_worker, args=(parent_pid,),
+                              kwargs=server_settings)
             process.daemon = True
             process.start()
             processes.append(process)
@@ -243,7 +326,9 @@ class Server:
         # the above processes will block this until they're stopped
         for process in processes:
             process.terminate()
-        server_settings.get('sock').close()
+        sock = server_settings.get('sock')
+        if sock is not None:
+            sock.close()
 
     def stop(self):
         self.loop.stop()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from mimetypes import guess_type
 from os import path
 from re import sub
@@ -16,6 +17,9 @@ from mach9.handlers import ContentRangeHandler
 from mach9.response import file, HTTPResponse
 
 
+_guess_type = lru_cache(maxsize=256)(guess_type)
+
+
 def register(app, uri, file_or_directory, pattern,
              use_modified_since, use_content_range):
     # TODO: Though mach9 is not a file server, I feel like we should at least
@@ -39,6 +43,7 @@ def register(app, uri, file_or_directory, pattern,
     # serve from the folder
     if not path.isfile(file_or_directory):
         uri += '<file_uri:' + pattern + '>'
+    root_path = path.abspath(unquote(file_or_directory))
 
     async def _handler(request, file_uri=None):
         # Using this to determine if the URL is trying to break out of the path
@@ -48,7 +53,7 @@ def register(app, uri, file_or_directory, pattern,
         # Merge served directory and requested file if provided
         # Strip all / that in the beginning of the URL to help prevent python
         # from herping a derp and treating the uri as an absolute path
-        root_path = file_path = file_or_directory
+        file_path = file_or_directory
         if file_uri:
             file_path = path.join(
                 file_or_directory, sub('^[/]*', '', file_uri))
@@ -56,7 +61,7 @@ def register(app, uri, file_or_directory, pattern,
         # URL decode the path sent by the browser otherwise we won't be able to
         # match filenames which got encoded (filenames with spaces etc)
         file_path = path.abspath(unquote(file_path))
-        if not file_path.startswith(path.abspath(unquote(root_path))):
+        if not file_path.startswith(root_path):
             raise FileNotFound('File not found',
                                path=file_or_directory,
                                relative_url=file_uri)
@@ -91,7 +96,7 @@ def register(app, uri, file_or_directory, pattern,
             if request.method == 'HEAD':
                 return HTTPResponse(
                     headers=headers,
-                    content_type=guess_type(file_path)[0] or 'text/plain')
+                    content_type=_guess_type(file_path)[0] or 'text/plain')
             else:
                 return await file(file_path, headers=headers, _range=_range)
         except ContentRangeError:
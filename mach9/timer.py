@@ -2,7 +2,9 @@ from time import time
 from functools import partial
 
 
-current_time = None
+# One-slot list so readers can use a C-level getter instead of a
+# Python function reading a module global
+_current_time = [time()]
 
 
 def update_current_time(loop):
@@ -12,10 +14,8 @@ def update_current_time(loop):
     :param loop:
     :return:
     """
-    global current_time
-    current_time = time()
+    _current_time[0] = time()
     loop.call_later(1, partial(update_current_time, loop))
 
 
-def get_current_time():
-    return current_time
+get_current_time = partial(_current_time.__getitem__, 0)
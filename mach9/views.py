@@ -1,6 +1,11 @@
 from mach9.exceptions import InvalidUsage
 
 
+HTTP_METHODS = ('GET', 'POST', 'PUT', 'HEAD', 'OPTIONS', 'PATCH', 'DELETE')
+# HTTP method -> name of the view method handling it
+_HANDLER_NAMES = {method: method.lower() for method in HTTP_METHODS}
+
+
 class HTTPMethodView:
     """Simple class based implementation of view for the mach9.
     You should implement methods (get, post, put, patch, delete) for the class
@@ -39,7 +44,12 @@ class HTTPMethodView:
     decorators = []
 
     def dispatch_request(self, request, *args, **kwargs):
-        handler = getattr(self, request.method.lower(), None)
+        name = _HANDLER_NAMES.get(request.method) or request.method.lower()
+        handler = getattr(self, name, None)
+        if handler is None:
+            raise InvalidUsage(
+                'Method {} not allowed for URL {}'.format(
+                    request.method, request.path), status_code=405)
         return handler(request, *args, **kwargs)
 
     @classmethod
@@ -89,12 +99,10 @@ class CompositionView:
         self._invalid_usage = invalid_usage or InvalidUsage
 
     def add(self, methods, handler, stream=False):
-        http_methods = (
-            'GET', 'POST', 'PUT', 'HEAD', 'OPTIONS', 'PATCH', 'DELETE')
         if stream:
             handler.is_stream = stream
         for method in methods:
-            if method not in http_methods:
+            if method not in HTTP_METHODS:
                 raise self._invalid_usage(
                     '{} is not a valid HTTP method.'.format(method))
 
@@ -4,6 +4,20 @@ from httptools import parse_url
 from typing import List
 
 
+_ConnectionClosed = websockets.exceptions.ConnectionClosed
+_InvalidHandshake = websockets.InvalidHandshake
+_check_request = websockets.handshake.check_request
+_build_response = websockets.handshake.build_response
+
+_STATUS_LINE = b'HTTP/1.1 101 Switching Protocols\r\n'
+_CRLF = b'\r\n'
+
+
+def build_accept_content(header_lines: List[bytes]) -> bytes:
+    '''Build the 101 response from already formatted header lines.'''
+    return b''.join([_STATUS_LINE] + header_lines + [_CRLF])
+
+
 class ReplyChannel:
     def __init__(self, websocket_protocol):
         self._websocket_protocol = websocket_protocol
@@ -29,13 +43,15 @@ class ReplyChannel:
 
 
 class WebSocketProtocol(WebSocketCommonProtocol):
-    def __init__(self, http_protocol, response_headers: List[List[bytes]],
+    def __init__(self, http_protocol, accept_content: bytes,
                  max_size=1000000, max_queue=100000):
         super().__init__(max_size=max_size, max_queue=max_queue,
                          loop=http_protocol.loop)
         self.request_handler = http_protocol.request_handler
         self.transport = http_protocol.transport
-        self.response_headers = response_headers
+        self.accept_content = accept_content
+        # set from the transport in connection_made
+        self._default_scheme = 'ws'
         self.channels = {
             'reply': ReplyChannel(self)
         }
@@ -43,15 +59,11 @@ class WebSocketProtocol(WebSocketCommonProtocol):
     def cleanup(self):
         self.request_handler = None
         self.transport = None
-        self.response_headers = None
+        self.accept_content = None
         self.channels = None
 
     def get_accept_content(self):
-        content = b'HTTP/1.1 101 Switching Protocols\r\n'
-        for key, value in self.response_headers:
-            content += key + b': ' + value + b'\r\n'
-        content += b'\r\n'
-        return content
+        return self.accept_content
 
     def get_connect_message(self, transport, http_version, method, url,
                             headers):
@@ -59,13 +71,8 @@ class WebSocketProtocol(WebSocketCommonProtocol):
         http://channels.readthedocs.io/en/stable/asgi/www.html#connection
         '''
         url_obj = parse_url(url)
-        if url_obj.schema is None:
-            if transport.get_extra_info('sslcontext'):
-                scheme = 'wss'
-            else:
-                scheme = 'ws'
-        else:
-            scheme = url_obj.schema.decode()
+        scheme = (self._default_scheme if url_obj.schema is None
+                  else url_obj.schema.decode())
         self.path = ('' if url_obj.path is None
                      else url_obj.path.decode('utf-8'))
         query = b'' if url_obj.query is None else url_obj.query
@@ -89,50 +96,56 @@ class WebSocketProtocol(WebSocketCommonProtocol):
         '''
         http://channels.readthedocs.io/en/stable/asgi/www.html#receive
         '''
-        self.order += 1
-        message = {
+        self.order = order = self.order + 1
+        text = data if isinstance(data, str) else None
+        binary = data if isinstance(data, bytes) else None
+        return {
             'channel': 'websocket.receive',
             'reply_channel': None,
             'path': self.path,
-            'order': self.order,
-            'text': None,
-            'bytes': None,
+            'order': order,
+            'text': text,
+            'bytes': binary,
         }
-        if isinstance(data, str):
-            message['text'] = data
-        elif isinstance(data, bytes):
-            message['bytes'] = data
-        return message
 
     def get_disconnect_message(self, code: int):
         '''
         http://channels.readthedocs.io/en/stable/asgi/www.html#disconnection
         '''
-        self.order += 1
+        self.order = order = self.order + 1
         return {
             'channel': 'websocket.disconnect',
             'reply_channel': None,
             'path': self.path,
-            'order': self.order,
+            'order': order,
             'code': code,
         }
 
     async def read(self):
         code = None
+        # bind per-frame lookups once, this loop runs for every frame
+        recv = self.recv
+        get_receive_message = self.get_receive_message
+        request_handler = self.request_handler
+        channels = self.channels
+        # read() is already a long-running task, so frames are handed to
+        # the request handler from here instead of spawning a task per frame
         while True:
             try:
-                data = await self.recv()
-            except websockets.exceptions.ConnectionClosed as e:
+                data = await recv()
+            except _ConnectionClosed as e:
                 code = e.code
                 break
-            message = self.get_receive_message(data)
-            self.loop.create_task(self.request_handler(message, self.channels))
+            message = get_receive_message(data)
+            await request_handler(message, channels)
         message = self.get_disconnect_message(code)
-        self.loop.create_task(self.request_handler(message, self.channels))
+        await request_handler(message, channels)
         self.cleanup()
 
     def connection_made(self, transport, http_version, method, url, headers):
         super().connection_made(transport)
+        if transport.get_extra_info('sslcontext'):
+            self._default_scheme = 'wss'
         message = self.get_connect_message(transport, http_version, method,
                                            url, headers)
         self.loop.create_task(self.request_handler(message, self.channels))
@@ -140,24 +153,30 @@ class WebSocketProtocol(WebSocketCommonProtocol):
 
 def upgrade_to_websocket(http_protocol):
     request_headers = dict(http_protocol.headers)
-    response_headers = []
+    header_lines = []
 
     def get_header(key):
         key = key.lower().encode('utf-8')
         return request_headers.get(key, b'').decode('utf-8')
 
     def set_header(key, value):
-        response_headers.append((key.encode('utf-8'), value.encode('utf-8')))
+        header_lines.append(
+            key.encode('utf-8') + b': ' + value.encode('utf-8') + b'\r\n')
 
     try:
-        key = websockets.handshake.check_request(get_header)
-        websockets.handshake.build_response(set_header, key)
-    except websockets.InvalidHandshake:
+        key = _check_request(get_header)
+        _build_response(set_header, key)
+    except _InvalidHandshake:
         http_protocol.send({
             'status': 400,
-            'headers': [[b'Content-Type', b'text/plain']],
+            # the connection is still flagged as an upgrade, so close it
+            # rather than keep it alive for further requests
+            'headers': [[b'Content-Type', b'text/plain'],
+                        [b'Connection', b'close']],
             'content': b'Invalid Handshake'})
-    websocket = WebSocketProtocol(http_protocol, response_headers)
+        return
+    accept_content = build_accept_content(header_lines)
+    websocket = WebSocketProtocol(http_protocol, accept_content)
     websocket.connection_made(http_protocol.transport,
                               http_protocol.parser.get_http_version(),
                               http_protocol.parser.get_method(),
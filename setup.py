@@ -17,11 +17,14 @@ setup_kwargs = {
     ],
     'install_requires': [
         'httptools',
-        'uvloop',
+        'uvloop; sys_platform != "win32"',
         'ujson',
         'aiofiles',
         'websockets',
-    ]
+    ],
+    'extras_require': {
+        'orjson': ['orjson'],
+    }
 }
 
 setup(**setup_kwargs)
@@ -0,0 +1,20 @@
+from mach9.connections import Connections
+
+
+class Unhashable:
+    __hash__ = None
+
+
+def test_connections():
+    connections = Connections()
+    connection1 = Unhashable()
+    connection2 = Unhashable()
+    connections.add(connection1)
+    connections.add(connection2)
+    assert len(connections) == 2
+    assert list(connections) == [connection1, connection2]
+    connections.discard(connection1)
+    connections.discard(connection1)
+    assert list(connections) == [connection2]
+    connections.discard(connection2)
+    assert not connections
@@ -41,6 +41,13 @@ def test_check_headers():
     assert result_headers['connection_close'] is False
     assert result_headers['content_length'] is True
 
+    result_headers = protocol.check_headers([
+        [b'connection', b'keep-alive, Close'],
+        [b'content-length', b'1'],
+    ])
+    assert result_headers['connection_close'] is True
+    assert result_headers['content_length'] is True
+
 
 def test_is_reponse_chunk():
     protocol = HttpProtocol(loop=None, request_handler=None)
@@ -112,6 +119,15 @@ def test_make_header_content():
         [[b'foo', b'bar']], result_headers, b'123', False)
     assert header_content == b'Content-Length: 3\r\nfoo: bar\r\n'
 
+    result_headers = {
+        'connection_close': False,
+        'content_length': True
+    }
+    header_content = protocol.make_header_content(
+        [[b'connection', b'1'], [b'foo', b'bar']], result_headers, b'123',
+        False)
+    assert header_content == b'foo: bar\r\n'
+
 
 def get_request_body_chunk():
     http_protocol = HttpProtocol(loop=None, request_handler=None,)
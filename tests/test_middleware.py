@@ -1,16 +1,39 @@
 from json import loads as json_loads, dumps as json_dumps
+import pytest
 from mach9 import Mach9
 from mach9.request import Request
 from mach9.response import json, text, HTTPResponse
 from mach9.exceptions import NotFound
 
 
+def make_app(name, body):
+    app = Mach9(name)
+
+    @app.route('/')
+    async def handler(request):
+        return text(body)
+
+    return app
+
+
+@pytest.fixture
+def ok_app(request):
+    '''App whose '/' route returns OK'''
+    return make_app(request.node.name, 'OK')
+
+
+@pytest.fixture
+def fail_app(request):
+    '''App whose '/' route returns FAIL'''
+    return make_app(request.node.name, 'FAIL')
+
+
 # ------------------------------------------------------------ #
 #  GET
 # ------------------------------------------------------------ #
 
-def test_middleware_request():
-    app = Mach9('test_middleware_request')
+def test_middleware_request(ok_app):
+    app = ok_app
 
     results = []
 
@@ -18,18 +41,14 @@ def test_middleware_request():
     async def handler(request):
         results.append(request)
 
-    @app.route('/')
-    async def handler(request):
-        return text('OK')
-
     request, response = app.test_client.get('/')
 
     assert response.text == 'OK'
     assert type(results[0]) is Request
 
 
-def test_middleware_response():
-    app = Mach9('test_middleware_response')
+def test_middleware_response(ok_app):
+    app = ok_app
 
     results = []
 
@@ -42,10 +61,6 @@ def test_middleware_response():
         results.append(request)
         results.append(response)
 
-    @app.route('/')
-    async def handler(request):
-        return text('OK')
-
     request, response = app.test_client.get('/')
 
     assert response.text == 'OK'
@@ -54,8 +69,8 @@ def test_middleware_response():
     assert isinstance(results[2], HTTPResponse)
 
 
-def test_middleware_response_exception():
-    app = Mach9('test_middleware_response_exception')
+def test_middleware_response_exception(fail_app):
+    app = fail_app
     result = {'status_code': None}
 
     @app.middleware('response')
@@ -67,42 +82,30 @@ def test_middleware_response_exception():
     async def error_handler(request, exception):
         return text('OK', exception.status_code)
 
-    @app.route('/')
-    async def handler(request):
-        return text('FAIL')
-
     request, response = app.test_client.get('/page_not_found')
     assert response.text == 'OK'
     assert result['status_code'] == 404
 
-def test_middleware_override_request():
-    app = Mach9('test_middleware_override_request')
+def test_middleware_override_request(fail_app):
+    app = fail_app
 
     @app.middleware
     async def halt_request(request):
         return text('OK')
 
-    @app.route('/')
-    async def handler(request):
-        return text('FAIL')
-
     response = app.test_client.get('/', gather_request=False)
 
     assert response.status == 200
     assert response.text == 'OK'
 
 
-def test_middleware_override_response():
-    app = Mach9('test_middleware_override_response')
+def test_middleware_override_response(fail_app):
+    app = fail_app
 
     @app.middleware('response')
     async def process_response(request, response):
         return text('OK')
 
-    @app.route('/')
-    async def handler(request):
-        return text('FAIL')
-
     request, response = app.test_client.get('/')
 
     assert response.status == 200
@@ -110,8 +113,8 @@ def test_middleware_override_response():
 
 
 
-def test_middleware_order():
-    app = Mach9('test_middleware_order')
+def test_middleware_order(ok_app):
+    app = ok_app
 
     order = []
 
@@ -139,10 +142,6 @@ def test_middleware_order():
     async def response3(request, response):
         order.append(4)
 
-    @app.route('/')
-    async def handler(request):
-        return text('OK')
-
     request, response = app.test_client.get('/')
 
     assert response.status == 200
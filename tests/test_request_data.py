@@ -1,8 +1,8 @@
 import random
+from json import loads
 
 from mach9 import Mach9
 from mach9.response import json
-from ujson import loads
 
 
 def test_storage():
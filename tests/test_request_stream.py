@@ -1,12 +1,14 @@
+from io import BytesIO
+
 from mach9 import Mach9
 from mach9.http import BodyChannel
 from mach9.blueprints import Blueprint
 from mach9.views import CompositionView
 from mach9.views import HTTPMethodView
 from mach9.views import stream as stream_decorator
-from mach9.response import text
+from mach9.response import raw, text
 
-data = 'abc' * 100000
+data = b'abc' * 100000
 
 
 def test_request_stream_method_view():
@@ -21,13 +23,13 @@ def test_request_stream_method_view():
         @stream_decorator
         async def post(self, request):
             assert isinstance(request.stream, BodyChannel)
-            result = ''
+            result = BytesIO()
             while True:
                 body_chunk = await request.stream.receive()
                 if body_chunk['more_content'] is False:
                     break
-                result += body_chunk['content'].decode('utf-8')
-            return text(result)
+                result.write(body_chunk['content'])
+            return raw(result.getvalue())
 
     app.add_route(SimpleView.as_view(), '/method_view')
 
@@ -37,7 +39,7 @@ def test_request_stream_method_view():
 
     request, response = app.test_client.post('/method_view', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
 
 def test_request_stream_app():
@@ -72,13 +74,13 @@ def test_request_stream_app():
     @app.post('/post/<id>', stream=True)
     async def post(request, id):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     @app.put('/_put')
     async def _put(request):
@@ -88,13 +90,13 @@ def test_request_stream_app():
     @app.put('/put', stream=True)
     async def put(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     @app.patch('/_patch')
     async def _patch(request):
@@ -104,13 +106,13 @@ def test_request_stream_app():
     @app.patch('/patch', stream=True)
     async def patch(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     request, response = app.test_client.post('/not_found')
     assert response.status == 404
@@ -137,7 +139,7 @@ def test_request_stream_app():
 
     request, response = app.test_client.post('/post/1', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.put('/_put', data=data)
     assert response.status == 200
@@ -145,7 +147,7 @@ def test_request_stream_app():
 
     request, response = app.test_client.put('/put', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.patch('/_patch', data=data)
     assert response.status == 200
@@ -153,7 +155,7 @@ def test_request_stream_app():
 
     request, response = app.test_client.patch('/patch', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
 
 def test_request_stream_blueprint():
@@ -189,13 +191,13 @@ def test_request_stream_blueprint():
     @bp.post('/post/<id>', stream=True)
     async def post(request, id):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     @bp.put('/_put')
     async def _put(request):
@@ -205,13 +207,13 @@ def test_request_stream_blueprint():
     @bp.put('/put', stream=True)
     async def put(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     @bp.patch('/_patch')
     async def _patch(request):
@@ -221,13 +223,13 @@ def test_request_stream_blueprint():
     @bp.patch('/patch', stream=True)
     async def patch(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     app.blueprint(bp)
 
@@ -253,7 +255,7 @@ def test_request_stream_blueprint():
 
     request, response = app.test_client.post('/post/1', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.put('/_put', data=data)
     assert response.status == 200
@@ -261,7 +263,7 @@ def test_request_stream_blueprint():
 
     request, response = app.test_client.put('/put', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.patch('/_patch', data=data)
     assert response.status == 200
@@ -269,7 +271,7 @@ def test_request_stream_blueprint():
 
     request, response = app.test_client.patch('/patch', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
 
 def test_request_stream_composition_view():
@@ -282,13 +284,13 @@ def test_request_stream_composition_view():
 
     async def post_handler(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     view = CompositionView()
     view.add(['GET'], get_handler)
@@ -301,7 +303,7 @@ def test_request_stream_composition_view():
 
     request, response = app.test_client.post('/composition_view', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
 
 def test_request_stream():
@@ -319,24 +321,24 @@ def test_request_stream():
         @stream_decorator
         async def post(self, request):
             assert isinstance(request.stream, BodyChannel)
-            result = ''
+            result = BytesIO()
             while True:
                 body_chunk = await request.stream.receive()
                 if body_chunk['more_content'] is False:
                     break
-                result += body_chunk['content'].decode('utf-8')
-            return text(result)
+                result.write(body_chunk['content'])
+            return raw(result.getvalue())
 
     @app.post('/stream', stream=True)
     async def handler(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     @app.get('/get')
     async def get(request):
@@ -346,13 +348,13 @@ def test_request_stream():
     @bp.post('/bp_stream', stream=True)
     async def bp_stream(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     @bp.get('/bp_get')
     async def bp_get(request):
@@ -365,13 +367,13 @@ def test_request_stream():
 
     async def post_handler(request):
         assert isinstance(request.stream, BodyChannel)
-        result = ''
+        result = BytesIO()
         while True:
             body_chunk = await request.stream.receive()
             if body_chunk['more_content'] is False:
                 break
-            result += body_chunk['content'].decode('utf-8')
-        return text(result)
+            result.write(body_chunk['content'])
+        return raw(result.getvalue())
 
     app.add_route(SimpleView.as_view(), '/method_view')
 
@@ -389,7 +391,7 @@ def test_request_stream():
 
     request, response = app.test_client.post('/method_view', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.get('/composition_view')
     assert response.status == 200
@@ -397,7 +399,7 @@ def test_request_stream():
 
     request, response = app.test_client.post('/composition_view', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.get('/get')
     assert response.status == 200
@@ -405,7 +407,7 @@ def test_request_stream():
 
     request, response = app.test_client.post('/stream', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
 
     request, response = app.test_client.get('/bp_get')
     assert response.status == 200
@@ -413,4 +415,4 @@ def test_request_stream():
 
     request, response = app.test_client.post('/bp_stream', data=data)
     assert response.status == 200
-    assert response.text == data
+    assert response.body == data
@@ -2,12 +2,13 @@ import pytest
 from random import choice
 import inspect
 import os
-from aiofiles import os as async_os
+from functools import lru_cache
+from json import loads as json_loads
 from mimetypes import guess_type
 from urllib.parse import unquote
 
 from mach9 import Mach9
-from mach9.response import HTTPResponse, file, text
+from mach9.response import HTTPResponse, file, json, text
 
 
 def test_response_body_not_a_string():
@@ -23,7 +24,33 @@ def test_response_body_not_a_string():
     assert response.text == str(random_num)
 
 
-@pytest.fixture
+def test_response_body_bytes():
+    '''Test that an already encoded body is sent unchanged'''
+    response = text('✓'.encode('utf-8'))
+    assert response.body == '✓'.encode('utf-8')
+    response = text(bytearray('✓'.encode('utf-8')))
+    assert response.body == '✓'.encode('utf-8')
+    assert type(response.body) is bytes
+    response = text('✓')
+    assert response.body == '✓'.encode('utf-8')
+
+
+def test_json_response_orjson():
+    '''Test that orjson serializes the body when it is installed'''
+    orjson = pytest.importorskip('orjson')
+    body = {'path': '/✓'}
+    response = json(body)
+    assert response.body == orjson.dumps(body)
+    assert json_loads(response.body.decode('utf-8')) == body
+
+
+def test_json_response_non_str_keys():
+    '''Test that data orjson rejects still serializes through ujson'''
+    response = json({1: 'one'})
+    assert json_loads(response.body.decode('utf-8')) == {'1': 'one'}
+
+
+@pytest.fixture(scope='module')
 def static_file_directory():
     '''The static directory to serve'''
     current_file = inspect.getfile(inspect.currentframe())
@@ -32,15 +59,15 @@ def static_file_directory():
     return static_directory
 
 
-def get_file_content(static_file_directory, file_name):
-    '''The content of the static file to check'''
-    with open(os.path.join(static_file_directory, file_name), 'rb') as file:
-        return file.read()
+@lru_cache(maxsize=32)
+def cached_stat(file_path):
+    '''The static files do not change while the tests run'''
+    return os.stat(file_path)
 
 
-@pytest.mark.parametrize(
-    'file_name', ['test.file', 'decode me.txt', 'python.png'])
-def test_file_response(file_name, static_file_directory):
+@pytest.fixture(scope='module')
+def file_app(static_file_directory):
+    '''One app shared by the parametrized file response tests'''
     app = Mach9('test_file_helper')
 
     @app.route('/files/<filename>', methods=['GET'])
@@ -50,20 +77,11 @@ def test_file_response(file_name, static_file_directory):
         return file(
             file_path, mime_type=guess_type(file_path)[0] or 'text/plain')
 
-    request, response = app.test_client.get('/files/{}'.format(file_name))
-    assert response.status == 200
-    assert response.body == get_file_content(static_file_directory, file_name)
-
-
-@pytest.mark.parametrize('file_name', ['test.file', 'decode me.txt'])
-def test_file_head_response(file_name, static_file_directory):
-    app = Mach9('test_file_helper')
-
-    @app.route('/files/<filename>', methods=['GET', 'HEAD'])
-    async def file_route(request, filename):
+    @app.route('/head_files/<filename>', methods=['GET', 'HEAD'])
+    async def head_file_route(request, filename):
         file_path = os.path.join(static_file_directory, filename)
         file_path = os.path.abspath(unquote(file_path))
-        stats = await async_os.stat(file_path)
+        stats = cached_stat(file_path)
         headers = dict()
         headers['Accept-Ranges'] = 'bytes'
         headers['Content-Length'] = str(stats.st_size)
@@ -75,13 +93,38 @@ def test_file_head_response(file_name, static_file_directory):
             return file(file_path, headers=headers,
                         mime_type=guess_type(file_path)[0] or 'text/plain')
 
-    request, response = app.test_client.head('/files/{}'.format(file_name))
+    return app
+
+
+@pytest.fixture(scope='module')
+def static_files(static_file_directory):
+    '''The content of the static files to check, read once'''
+    contents = {}
+    for file_name in os.listdir(static_file_directory):
+        with open(os.path.join(static_file_directory, file_name),
+                  'rb') as file:
+            contents[file_name] = file.read()
+    return contents
+
+
+@pytest.mark.parametrize(
+    'file_name', ['test.file', 'decode me.txt', 'python.png'])
+def test_file_response(file_name, static_files, file_app):
+    request, response = file_app.test_client.get(
+        '/files/{}'.format(file_name))
+    assert response.status == 200
+    assert response.body == static_files[file_name]
+
+
+@pytest.mark.parametrize('file_name', ['test.file', 'decode me.txt'])
+def test_file_head_response(file_name, static_files, file_app):
+    request, response = file_app.test_client.head(
+        '/head_files/{}'.format(file_name))
     assert response.status == 200
     assert 'Accept-Ranges' in response.headers
     assert 'Content-Length' in response.headers
     assert int(response.headers[
-               'Content-Length']) == len(
-                   get_file_content(static_file_directory, file_name))
+               'Content-Length']) == len(static_files[file_name])
 
 
 def test_connection_close():
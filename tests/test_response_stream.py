@@ -3,7 +3,7 @@ from mach9.response import stream
 from mach9.http import BodyChannel
 
 
-data = 'abc' * 100000
+data = b'abc' * 100000
 app = Mach9('test_response_stream')
 
 
@@ -1,4 +1,5 @@
 from json import loads as json_loads, dumps as json_dumps
+import pytest
 from mach9 import Mach9
 from mach9.response import json, text
 
@@ -7,25 +8,30 @@ from mach9.response import json, text
 #  UTF-8
 # ------------------------------------------------------------ #
 
-def test_utf8_query_string():
-    app = Mach9('test_utf8_query_string')
+@pytest.fixture(scope='module')
+def utf8_app():
+    '''One app shared by the UTF-8 tests'''
+    app = Mach9('test_utf8')
 
     @app.route('/')
     async def handler(request):
         return text('OK')
 
-    request, response = app.test_client.get('/', params=[("utf8", '✓')])
-    assert request.args.get('utf8') == '✓'
+    @app.route('/utf8')
+    async def utf8_handler(request):
+        return text('✓')
 
+    return app
 
-def test_utf8_response():
-    app = Mach9('test_utf8_response')
 
-    @app.route('/')
-    async def handler(request):
-        return text('✓')
+def test_utf8_query_string(utf8_app):
+    request, response = utf8_app.test_client.get(
+        '/', params=[("utf8", '✓')])
+    assert request.args.get('utf8') == '✓'
 
-    request, response = app.test_client.get('/')
+
+def test_utf8_response(utf8_app):
+    request, response = utf8_app.test_client.get('/utf8')
     assert response.text == '✓'
 
 
@@ -41,17 +47,11 @@ def skip_test_utf8_route():
     assert response.text == 'OK'
 
 
-def test_utf8_post_json():
-    app = Mach9('test_utf8_post_json')
-
-    @app.route('/')
-    async def handler(request):
-        return text('OK')
-
+def test_utf8_post_json(utf8_app):
     payload = {'test': '✓'}
     headers = {'content-type': 'application/json'}
 
-    request, response = app.test_client.get(
+    request, response = utf8_app.test_client.get(
         '/',
         data=json_dumps(payload), headers=headers)
 
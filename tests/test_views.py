@@ -1,4 +1,5 @@
 import pytest as pytest
+from types import SimpleNamespace
 
 from mach9 import Mach9
 from mach9.exceptions import InvalidUsage
@@ -202,6 +203,74 @@ def test_with_decorator():
     assert results[0] == 1
 
 
+def test_dispatch_subclass_overrides_method():
+    class BaseView(HTTPMethodView):
+
+        def get(self, request):
+            return 'base'
+
+    class ChildView(BaseView):
+
+        def get(self, request):
+            return 'child'
+
+    request = SimpleNamespace(method='GET', path='/')
+    assert ChildView().dispatch_request(request) == 'child'
+    assert BaseView().dispatch_request(request) == 'base'
+
+
+def test_dispatch_instance_method():
+    class DummyView(HTTPMethodView):
+
+        def __init__(self):
+            self.post = lambda request: 'instance'
+
+    request = SimpleNamespace(method='POST', path='/')
+    assert DummyView().dispatch_request(request) == 'instance'
+
+
+def test_dispatch_instance_overrides_method():
+    class DummyView(HTTPMethodView):
+
+        def __init__(self):
+            self.get = lambda request: 'instance'
+
+        def get(self, request):
+            return 'class'
+
+    request = SimpleNamespace(method='GET', path='/')
+    assert DummyView().dispatch_request(request) == 'instance'
+
+
+def test_dispatch_static_and_class_methods():
+    class DummyView(HTTPMethodView):
+
+        @staticmethod
+        def get(request):
+            return 'static'
+
+        @classmethod
+        def post(cls, request):
+            return cls.__name__
+
+    assert DummyView().dispatch_request(
+        SimpleNamespace(method='GET', path='/')) == 'static'
+    assert DummyView().dispatch_request(
+        SimpleNamespace(method='POST', path='/')) == 'DummyView'
+
+
+def test_dispatch_method_not_allowed():
+    class DummyView(HTTPMethodView):
+
+        def get(self, request):
+            return 'get'
+
+    request = SimpleNamespace(method='POST', path='/')
+    with pytest.raises(InvalidUsage) as excinfo:
+        DummyView().dispatch_request(request)
+    assert excinfo.value.status_code == 405
+
+
 def test_composition_view_rejects_incorrect_methods():
     def foo(request):
         return text('Foo')
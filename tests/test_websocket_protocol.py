@@ -1,32 +1,54 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
 from mach9.http import HttpProtocol
-from mach9.websocket import WebSocketProtocol
+from mach9.websocket import (
+    WebSocketProtocol, build_accept_content, upgrade_to_websocket)
 from tests.utils import Transport
 
 
+class UpgradeTransport(Transport):
+    protocol = None
+
+    def set_protocol(self, protocol):
+        self.protocol = protocol
+
+
+class Parser:
+
+    def get_http_version(self):
+        return '1.1'
+
+    def get_method(self):
+        return b'GET'
+
+
 def test_cleanup():
     http_protocol = HttpProtocol(loop=None, request_handler=None)
-    headers = [[b'foo', b'bar']]
-    websocket_protocol = WebSocketProtocol(http_protocol, headers)
+    accept_content = build_accept_content([b'foo: bar\r\n'])
+    websocket_protocol = WebSocketProtocol(http_protocol, accept_content)
     websocket_protocol.cleanup()
     assert websocket_protocol.request_handler is None
     assert websocket_protocol.transport is None
-    assert websocket_protocol.response_headers is None
+    assert websocket_protocol.accept_content is None
     assert websocket_protocol.channels is None
 
 
 def test_accept_content():
-    http_protocol = HttpProtocol(loop=None, request_handler=None)
-    headers = [[b'foo', b'bar']]
-    websocket_protocol = WebSocketProtocol(http_protocol, headers)
-    content = websocket_protocol.get_accept_content()
+    content = build_accept_content([b'foo: bar\r\n'])
     output = b'HTTP/1.1 101 Switching Protocols\r\nfoo: bar\r\n\r\n'
     assert content == output
+    http_protocol = HttpProtocol(loop=None, request_handler=None)
+    websocket_protocol = WebSocketProtocol(http_protocol, content)
+    assert websocket_protocol.get_accept_content() == output
 
 
 def test_get_connect_message():
     http_protocol = HttpProtocol(loop=None, request_handler=None)
-    headers = [[b'foo', b'bar']]
-    websocket_protocol = WebSocketProtocol(http_protocol, headers)
+    accept_content = build_accept_content([b'foo: bar\r\n'])
+    websocket_protocol = WebSocketProtocol(http_protocol, accept_content)
     transport = Transport()
     message = websocket_protocol.get_connect_message(
         transport,
@@ -51,8 +73,8 @@ def test_get_connect_message():
 
 def test_get_receive_message():
     http_protocol = HttpProtocol(loop=None, request_handler=None)
-    headers = [[b'foo', b'bar']]
-    websocket_protocol = WebSocketProtocol(http_protocol, headers)
+    accept_content = build_accept_content([b'foo: bar\r\n'])
+    websocket_protocol = WebSocketProtocol(http_protocol, accept_content)
     transport = Transport()
     websocket_protocol.get_connect_message(
         transport,
@@ -75,8 +97,8 @@ def test_get_receive_message():
 
 def test_get_disconnect_message():
     http_protocol = HttpProtocol(loop=None, request_handler=None)
-    headers = [[b'foo', b'bar']]
-    websocket_protocol = WebSocketProtocol(http_protocol, headers)
+    accept_content = build_accept_content([b'foo: bar\r\n'])
+    websocket_protocol = WebSocketProtocol(http_protocol, accept_content)
     transport = Transport()
     websocket_protocol.get_connect_message(
         transport,
@@ -91,3 +113,53 @@ def test_get_disconnect_message():
     assert message['path'] == '/foo/bar'
     assert message['order'] == 1
     assert message['code'] == 1000
+
+
+def test_upgrade_to_websocket_invalid_handshake():
+    sent = []
+    transport = UpgradeTransport()
+    http_protocol = SimpleNamespace(
+        headers=[[b'upgrade', b'websocket']],
+        transport=transport,
+        send=sent.append)
+    upgrade_to_websocket(http_protocol)
+    assert sent[0]['status'] == 400
+    assert sent[0]['content'] == b'Invalid Handshake'
+    assert transport.protocol is None
+    # keep-alive is turned off for the 400
+    protocol = HttpProtocol(loop=None, request_handler=None)
+    result_headers = protocol.check_headers(sent[0]['headers'])
+    assert result_headers['connection_close'] is True
+
+
+@pytest.mark.asyncio
+async def test_upgrade_to_websocket():
+    messages = []
+
+    async def request_handler(message, channels):
+        messages.append(message)
+
+    transport = UpgradeTransport()
+    http_protocol = SimpleNamespace(
+        loop=asyncio.get_event_loop(),
+        request_handler=request_handler,
+        headers=[
+            [b'upgrade', b'websocket'],
+            [b'connection', b'Upgrade'],
+            [b'sec-websocket-key', b'dGhlIHNhbXBsZSBub25jZQ=='],
+            [b'sec-websocket-version', b'13'],
+        ],
+        url=b'/foo/bar',
+        parser=Parser(),
+        transport=transport,
+        send=None)
+    upgrade_to_websocket(http_protocol)
+    websocket_protocol = transport.protocol
+    assert isinstance(websocket_protocol, WebSocketProtocol)
+    content = websocket_protocol.get_accept_content()
+    assert content.startswith(b'HTTP/1.1 101 Switching Protocols\r\n')
+    assert b'Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=\r\n' in content
+    assert content.endswith(b'\r\n\r\n')
+    await asyncio.sleep(0)
+    assert messages[0]['channel'] == 'websocket.connect'
+    assert messages[0]['path'] == '/foo/bar'